@@ -429,8 +429,10 @@ class _Manager:
         use_juju_for_storage = self._use_juju_for_storage
         if use_juju_for_storage and not ops.storage.juju_backend_available():
             # raise an exception; the charm is broken and needs fixing.
-            msg = 'charm set use_juju_for_storage=True, but Juju version {} does not support it'
-            raise RuntimeError(msg.format(self._juju_context.version))
+            raise RuntimeError(
+                'charm set use_juju_for_storage=True, but Juju version '
+                f'{self._juju_context.version} does not support it'
+            )
 
         if use_juju_for_storage is None:
             use_juju_for_storage = _should_use_controller_storage(
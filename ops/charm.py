@@ -31,6 +31,7 @@ from typing import (
     Optional,
     TextIO,
     Tuple,
+    Type,
     TypedDict,
     Union,
     cast,
@@ -527,9 +528,8 @@ class RelationEvent(HookEvent):
         )
         if relation is None:
             raise ValueError(
-                'Unable to restore {}: relation {} (id={}) not found.'.format(
-                    self, snapshot['relation_name'], snapshot['relation_id']
-                )
+                f'Unable to restore {self}: relation {snapshot["relation_name"]} '
+                f'(id={snapshot["relation_id"]}) not found.'
             )
         self.relation = relation
 
@@ -1289,6 +1289,28 @@ class CharmEvents(ObjectEvents):
     """
 
 
+# The events that CharmBase defines for each relation, storage, action, and
+# container in the charm's metadata, as (event kind suffix, event type) pairs.
+_RELATION_EVENT_SUFFIXES: Tuple[Tuple[str, Type[EventBase]], ...] = (
+    ('_relation_created', RelationCreatedEvent),
+    ('_relation_joined', RelationJoinedEvent),
+    ('_relation_changed', RelationChangedEvent),
+    ('_relation_departed', RelationDepartedEvent),
+    ('_relation_broken', RelationBrokenEvent),
+)
+_STORAGE_EVENT_SUFFIXES: Tuple[Tuple[str, Type[EventBase]], ...] = (
+    ('_storage_attached', StorageAttachedEvent),
+    ('_storage_detaching', StorageDetachingEvent),
+)
+_ACTION_EVENT_SUFFIXES: Tuple[Tuple[str, Type[EventBase]], ...] = (('_action', ActionEvent),)
+_CONTAINER_EVENT_SUFFIXES: Tuple[Tuple[str, Type[EventBase]], ...] = (
+    ('_pebble_ready', PebbleReadyEvent),
+    ('_pebble_custom_notice', PebbleCustomNoticeEvent),
+    ('_pebble_check_failed', PebbleCheckFailedEvent),
+    ('_pebble_check_recovered', PebbleCheckRecoveredEvent),
+)
+
+
 class CharmBase(Object):
     """Base class that represents the charm overall.
 
@@ -1333,31 +1355,42 @@ class CharmBase(Object):
     def __init__(self, framework: Framework):
         super().__init__(framework, None)
 
-        for relation_name in self.framework.meta.relations:
-            relation_name = relation_name.replace('-', '_')
-            self.on.define_event(f'{relation_name}_relation_created', RelationCreatedEvent)
-            self.on.define_event(f'{relation_name}_relation_joined', RelationJoinedEvent)
-            self.on.define_event(f'{relation_name}_relation_changed', RelationChangedEvent)
-            self.on.define_event(f'{relation_name}_relation_departed', RelationDepartedEvent)
-            self.on.define_event(f'{relation_name}_relation_broken', RelationBrokenEvent)
-
-        for storage_name in self.framework.meta.storages:
-            storage_name = storage_name.replace('-', '_')
-            self.on.define_event(f'{storage_name}_storage_attached', StorageAttachedEvent)
-            self.on.define_event(f'{storage_name}_storage_detaching', StorageDetachingEvent)
-
-        for action_name in self.framework.meta.actions:
-            action_name = action_name.replace('-', '_')
-            self.on.define_event(f'{action_name}_action', ActionEvent)
-
-        for container_name in self.framework.meta.containers:
-            container_name = container_name.replace('-', '_')
-            self.on.define_event(f'{container_name}_pebble_ready', PebbleReadyEvent)
-            self.on.define_event(f'{container_name}_pebble_custom_notice', PebbleCustomNoticeEvent)
-            self.on.define_event(f'{container_name}_pebble_check_failed', PebbleCheckFailedEvent)
-            self.on.define_event(
-                f'{container_name}_pebble_check_recovered', PebbleCheckRecoveredEvent
-            )
+        charm_type = type(self)
+        charm_on = charm_type.__dict__.get('on')
+        # Only set if the class's 'on' is one generated below, not one the charm declared.
+        derived_from = None if charm_on is None else vars(type(charm_on)).get('_ops_derived_from')
+        if charm_on is None or derived_from is not None:
+            # Give each charm class its own events type, so that the events defined
+            # below from the metadata are not added to a type shared with other
+            # charm classes (such as CharmEvents itself). The generated type
+            # remembers which type it was derived from, and is replaced if the
+            # inherited 'on' has since been swapped for one of a different type.
+            events_type = type(super(charm_type, charm_type).on)
+            if derived_from is not events_type:
+                charm_events_type = type(
+                    events_type.__name__,
+                    (events_type,),
+                    {
+                        '__module__': events_type.__module__,
+                        '__qualname__': events_type.__qualname__,
+                        '_ops_derived_from': events_type,
+                    },
+                )
+                charm_type.on = charm_events_type()  # type: ignore
+
+        meta = self.framework.meta
+        # Each access to self.on goes through the ObjectEvents descriptor.
+        on = self.on
+        for names, suffixes in (
+            (meta.relations, _RELATION_EVENT_SUFFIXES),
+            (meta.storages, _STORAGE_EVENT_SUFFIXES),
+            (meta.actions, _ACTION_EVENT_SUFFIXES),
+            (meta.containers, _CONTAINER_EVENT_SUFFIXES),
+        ):
+            for name in names:
+                prefix = name.replace('-', '_')
+                for suffix, event_type in suffixes:
+                    on.define_event(prefix + suffix, event_type)
 
     @property
     def app(self) -> model.Application:
@@ -1390,13 +1423,14 @@ def _evaluate_status(charm: CharmBase):  # pyright: ignore[reportUnusedFunction]
 
     See :class:`CollectStatusEvent` for details.
     """
+    on = charm.on
     if charm.framework.model._backend.is_leader():
-        charm.on.collect_app_status.emit()
+        on.collect_app_status.emit()
         app = charm.app
         if app._collected_statuses:
             app.status = model.StatusBase._get_highest_priority(app._collected_statuses)
 
-    charm.on.collect_unit_status.emit()
+    on.collect_unit_status.emit()
     unit = charm.unit
     if unit._collected_statuses:
         unit.status = model.StatusBase._get_highest_priority(unit._collected_statuses)
@@ -1524,22 +1558,19 @@ class CharmMeta:
         # Note that metadata v2 does not define min-juju-version ('assumes'
         # should be used instead).
         self.min_juju_version = raw_.get('min-juju-version')
-        self.requires = {
-            name: RelationMeta(RelationRole.requires, name, rel)
-            for name, rel in raw_.get('requires', {}).items()
-        }
-        self.provides = {
-            name: RelationMeta(RelationRole.provides, name, rel)
-            for name, rel in raw_.get('provides', {}).items()
-        }
-        self.peers = {
-            name: RelationMeta(RelationRole.peer, name, rel)
-            for name, rel in raw_.get('peers', {}).items()
-        }
-        self.relations: Dict[str, RelationMeta] = {}
-        self.relations.update(self.requires)
-        self.relations.update(self.provides)
-        self.relations.update(self.peers)
+        self.requires = {}
+        self.provides = {}
+        self.peers = {}
+        self.relations = {}
+        for key, role, role_relations in (
+            ('requires', RelationRole.requires, self.requires),
+            ('provides', RelationRole.provides, self.provides),
+            ('peers', RelationRole.peer, self.peers),
+        ):
+            for name, rel in raw_.get(key, {}).items():
+                relation_meta = RelationMeta(role, name, rel)
+                role_relations[name] = relation_meta
+                self.relations[name] = relation_meta
         self.storages = {
             name: StorageMeta(name, storage) for name, storage in raw_.get('storage', {}).items()
         }
@@ -1568,9 +1599,11 @@ class CharmMeta:
         actions = None
 
         actions_path = _charm_root / 'actions.yaml'
-        if actions_path.exists():
+        try:
             with actions_path.open() as f:
                 actions = yaml.safe_load(f.read())
+        except FileNotFoundError:
+            pass
 
         return CharmMeta(meta, actions)
 
@@ -1611,7 +1644,8 @@ class CharmMeta:
 
         Args:
             metadata: A YAML description of charm metadata (name, relations, etc.)
-                This can be a simple string, or a file-like object (passed to ``yaml.safe_load``).
+                This can be a simple string, or a file-like object. It is parsed
+                with PyYAML's LibYAML-based ``CSafeLoader`` when that is available.
             actions: YAML description of Actions for this charm (e.g., actions.yaml)
         """
         meta = yaml.safe_load(metadata)
@@ -1685,7 +1719,6 @@ class RelationMeta:
         assert isinstance(
             role, RelationRole
         ), f'role should be one of {list(RelationRole)!r}, not {role!r}'
-        self._default_scope = self.VALID_SCOPES[0]
         self.role = role
         self.relation_name = relation_name
         self.interface_name = raw['interface']
@@ -1694,13 +1727,10 @@ class RelationMeta:
         if limit is not None and not isinstance(limit, int):
             raise TypeError(f'limit should be an int, not {type(limit)}')
 
-        self.scope = raw.get('scope') or self._default_scope
+        self.scope = raw.get('scope') or self.VALID_SCOPES[0]
         if self.scope not in self.VALID_SCOPES:
-            raise TypeError(
-                "scope should be one of {}; not '{}'".format(
-                    ', '.join(f"'{s}'" for s in self.VALID_SCOPES), self.scope
-                )
-            )
+            valid_scopes = ', '.join(f"'{s}'" for s in self.VALID_SCOPES)
+            raise TypeError(f"scope should be one of {valid_scopes}; not '{self.scope}'")
 
         self.optional = raw.get('optional', False)
 
@@ -1732,7 +1762,7 @@ class StorageMeta:
     multiple_range: Optional[Tuple[int, Optional[int]]]
     """Range of numeric qualifiers when multiple storage units are used."""
 
-    properties = List[str]
+    properties: List[str]
     """List of additional characteristics of the storage."""
 
     def __init__(self, name: str, raw: '_StorageMetaDict'):
@@ -1745,14 +1775,16 @@ class StorageMeta:
         self.location = raw.get('location')
         self.multiple_range = None
         if 'multiple' in raw:
-            range = raw['multiple']['range']
-            if range[-1] == '+':
-                self.multiple_range = (int(range[:-1]), None)
-            elif '-' not in range:
-                self.multiple_range = (int(range), int(range))
+            range_ = raw['multiple']['range']
+            if range_[-1] == '+':
+                self.multiple_range = (int(range_[:-1]), None)
             else:
-                range = range.split('-')
-                self.multiple_range = (int(range[0]), int(range[1]) if range[1] else None)
+                low, sep, high = range_.partition('-')
+                if not sep:
+                    count = int(low)
+                    self.multiple_range = (count, count)
+                else:
+                    self.multiple_range = (int(low), int(high) if high else None)
         self.properties = raw.get('properties', [])
 
 
@@ -1918,13 +1950,16 @@ class ContainerMeta:
 
     def __init__(self, name: str, raw: Dict[str, Any]):
         self.name = name
-        self._mounts: Dict[str, ContainerStorageMeta] = {}
+        # The mounts mapping is rarely read, so it is built on first access
+        # rather than on every hook.
+        self._mounts: Optional[Dict[str, ContainerStorageMeta]] = None
+        self._raw_mounts: List[_MountDict] = []
         self.bases = None
         self.resource = None
 
         # This is not guaranteed to be populated/is not enforced yet
         if raw:
-            self._populate_mounts(raw.get('mounts', []))
+            self._raw_mounts = raw.get('mounts', [])
             self.resource = raw.get('resource')
             self.bases = [ContainerBase.from_dict(base) for base in raw.get('bases', ())]
 
@@ -1949,15 +1984,19 @@ class ContainerMeta:
                   - storage: foo
                   - location: /test/mount
         """
+        if self._mounts is None:
+            self._mounts = self._populate_mounts(self._raw_mounts)
         return self._mounts
 
-    def _populate_mounts(self, mounts: List['_MountDict']):
+    @staticmethod
+    def _populate_mounts(mounts: List['_MountDict']) -> Dict[str, 'ContainerStorageMeta']:
         """Populate a list of container mountpoints.
 
         Since Charm Metadata v2 specifies the mounts as a List, do a little data manipulation
         to convert the values to "friendly" names which contain a list of mountpoints
         under each key.
         """
+        result: Dict[str, ContainerStorageMeta] = {}
         for mount in mounts:
             storage = mount.get('storage', '')
             mount = mount.get('location', '')
@@ -1965,10 +2004,11 @@ class ContainerMeta:
             if not mount:
                 continue
 
-            if storage in self._mounts:
-                self._mounts[storage].add_location(mount)
+            if storage in result:
+                result[storage].add_location(mount)
             else:
-                self._mounts[storage] = ContainerStorageMeta(storage, mount)
+                result[storage] = ContainerStorageMeta(storage, mount)
+        return result
 
 
 class ContainerStorageMeta:
@@ -285,15 +285,11 @@ class EventSource:
 
     def __set_name__(self, emitter_type: 'Type[Object]', event_kind: str):
         if self.event_kind is not None:
+            # emitter_type could still be None
+            prev_emitter = getattr(self.emitter_type, '__name__', self.emitter_type)
             raise RuntimeError(
-                'EventSource({}) reused as {}.{} and {}.{}'.format(
-                    self.event_type.__name__,
-                    # emitter_type could still be None
-                    getattr(self.emitter_type, '__name__', self.emitter_type),
-                    self.event_kind,
-                    emitter_type.__name__,
-                    event_kind,
-                )
+                f'EventSource({self.event_type.__name__}) reused as '
+                f'{prev_emitter}.{self.event_kind} and {emitter_type.__name__}.{event_kind}'
             )
         self.event_kind = event_kind
         self.emitter_type = emitter_type
@@ -420,7 +416,10 @@ class ObjectEvents(Object):
 
     def __init__(self, parent: Optional[Object] = None, key: Optional[str] = None):
         if parent is not None:
+            # This is the per-emitter instance handed out by __get__, which
+            # never acts as a descriptor itself, so it doesn't need a cache.
             super().__init__(parent, key)
+            return
         self._cache: weakref.WeakKeyDictionary[Object, ObjectEvents] = weakref.WeakKeyDictionary()
 
     def __get__(self, emitter: Object, emitter_type: 'Type[Object]'):
@@ -574,6 +573,9 @@ More details at https://juju.is/docs/sdk/debugging
 """
 
 _event_regex = r'^(|.*/)on/[a-zA-Z_]+\[\d+\]$'
+_EVENT_RE = re.compile(_event_regex)
+
+_BREAKPOINT_NAME_RE = re.compile(r'^[a-z0-9]([a-z0-9\-]*[a-z0-9])?$')
 
 
 class Framework(Object):
@@ -737,8 +739,10 @@ class Framework(Object):
         try:
             marshal.dumps(data)
         except ValueError:
-            msg = 'unable to save the data for {}, it must contain only simple types: {!r}'
-            raise ValueError(msg.format(value.__class__.__name__, data)) from None
+            raise ValueError(
+                f'unable to save the data for {value.__class__.__name__}, '
+                f'it must contain only simple types: {data!r}'
+            ) from None
 
     def save_snapshot(self, value: Union['StoredStateData', 'EventBase']):
         """Save a persistent snapshot of the provided value."""
@@ -986,10 +990,11 @@ class Framework(Object):
                 if custom_handler:
                     event_is_from_juju = isinstance(event, charm.HookEvent)
                     event_is_action = isinstance(event, charm.ActionEvent)
+                    debug_at = self._juju_debug_at
                     with self._event_context(event_handle.kind):
-                        if (
-                            event_is_from_juju or event_is_action
-                        ) and self._juju_debug_at.intersection({'all', 'hook'}):
+                        if (event_is_from_juju or event_is_action) and (
+                            'all' in debug_at or 'hook' in debug_at
+                        ):
                             # Present the welcome message and run under PDB.
                             self._show_debug_code_message()
                             pdb.runcall(custom_handler, event)
@@ -1043,7 +1048,7 @@ class Framework(Object):
                 raise TypeError('breakpoint names must be strings')
             if name in ('hook', 'all'):
                 raise ValueError('breakpoint names "all" and "hook" are reserved')
-            if not re.match(r'^[a-z0-9]([a-z0-9\-]*[a-z0-9])?$', name):
+            if not _BREAKPOINT_NAME_RE.match(name):
                 raise ValueError('breakpoint names must look like "foo" or "foo-bar"')
 
         indicated_breakpoints = self._juju_debug_at
@@ -1071,10 +1076,9 @@ class Framework(Object):
         never deleted. This makes a best effort to find these events and remove them from the
         database.
         """
-        event_regex = re.compile(_event_regex)
         to_remove: List[str] = []
         for handle_path in self._storage.list_snapshots():
-            if event_regex.match(handle_path):
+            if _EVENT_RE.match(handle_path):
                 notices = self._storage.notices(handle_path)
                 if next(notices, None) is None:
                     # There are no notices for this handle_path, it is valid to remove it
@@ -29,6 +29,8 @@ class JujuLogHandler(logging.Handler):
     def __init__(self, model_backend: _ModelBackend, level: int = logging.DEBUG):
         super().__init__(level)
         self.model_backend = model_backend
+        # Charms can log many records per hook, so avoid looking this up for each one.
+        self._juju_log = model_backend.juju_log
 
     def emit(self, record: logging.LogRecord):
         """Send the specified logging record to the Juju backend.
@@ -36,7 +38,18 @@ class JujuLogHandler(logging.Handler):
         This method is not used directly by the ops library, but by
         :class:`logging.Handler` itself as part of the logging machinery.
         """
-        self.model_backend.juju_log(record.levelname, self.format(record))
+        if (
+            self.formatter is None
+            and not record.exc_info
+            and not record.exc_text
+            and not record.stack_info
+        ):
+            # This is what the default formatter would produce, without the
+            # overhead of going through it for every record.
+            message = record.getMessage()
+        else:
+            message = self.format(record)
+        self._juju_log(record.levelname, message)
 
 
 def setup_root_logging(
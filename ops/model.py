@@ -909,15 +909,15 @@ class RelationMapping(Mapping[str, List['Relation']]):
         cache: '_ModelCache',
         broken_relation_id: Optional[int],
     ):
-        self._peers: Set[str] = set()
-        for name, relation_meta in relations_meta.items():
-            if relation_meta.role.is_peer():
-                self._peers.add(name)
+        self._peers: Set[str] = {
+            name for name, relation_meta in relations_meta.items() if relation_meta.role.is_peer()
+        }
         self._our_unit = our_unit
         self._backend = backend
         self._cache = cache
         self._broken_relation_id = broken_relation_id
-        self._data: _RelationMapping_Raw = {r: None for r in relations_meta}
+        # Relation lists are only fetched from Juju when first looked up.
+        self._data: _RelationMapping_Raw = dict.fromkeys(relations_meta)
 
     def __contains__(self, key: str):
         return key in self._data
@@ -975,10 +975,10 @@ class RelationMapping(Mapping[str, List['Relation']]):
                 )
         relations = self[relation_name]
         num_related = len(relations)
-        if num_related == 0:
+        if num_related == 1:
+            return relations[0]
+        elif num_related == 0:
             return None
-        elif num_related == 1:
-            return self[relation_name][0]
         else:
             # TODO: We need something in the framework to catch and gracefully handle
             # errors, ideally integrating the error catching with Juju's mechanisms.
@@ -1113,13 +1113,12 @@ class Network:
                 for address_info in addrs:
                     self.interfaces.append(NetworkInterface(interface_name, address_info))
 
-        self.ingress_addresses = []
-        for address in network_info.get('ingress-addresses', []):
-            self.ingress_addresses.append(_cast_network_address(address))
-
-        self.egress_subnets = []
-        for subnet in network_info.get('egress-subnets', []):
-            self.egress_subnets.append(ipaddress.ip_network(subnet))
+        self.ingress_addresses = [
+            _cast_network_address(address) for address in network_info.get('ingress-addresses', [])
+        ]
+        self.egress_subnets = [
+            ipaddress.ip_network(subnet) for subnet in network_info.get('egress-subnets', [])
+        ]
 
     @property
     def bind_address(self) -> Optional[Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]]:
@@ -3436,11 +3435,11 @@ class _ModelBackend:
         The value is cached for the duration of a lease which is 30s in Juju.
         """
         now = time.monotonic()
-        if self._leader_check_time is None:
-            check = True
-        else:
-            time_since_check = datetime.timedelta(seconds=now - self._leader_check_time)
-            check = time_since_check > self.LEASE_RENEWAL_PERIOD or self._is_leader is None
+        check = (
+            self._is_leader is None
+            or self._leader_check_time is None
+            or now - self._leader_check_time > self.LEASE_RENEWAL_PERIOD.total_seconds()
+        )
         if check:
             # Current time MUST be saved before running is-leader to ensure the cache
             # is only used inside the window that is-leader itself asserts.
@@ -3895,7 +3894,7 @@ class _ModelBackendValidator:
         if not value:
             raise ModelError(f'metric label {label} has an empty value, which is not allowed')
         v = str(value)
-        if re.search('[,=]', v) is not None:
+        if ',' in v or '=' in v:
             raise ModelError(f'metric label values must not contain "," or "=": {label}={value!r}')
 
 
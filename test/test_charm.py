@@ -140,6 +140,59 @@ def test_helper_properties(request: pytest.FixtureRequest):
     assert charm.config is framework.model.config
 
 
+def test_metadata_events_not_shared(request: pytest.FixtureRequest):
+    class MyCharm(ops.CharmBase):
+        pass
+
+    class OtherCharm(ops.CharmBase):
+        pass
+
+    meta = ops.CharmMeta.from_yaml("""
+name: my-charm
+requires:
+  db:
+    interface: db
+""")
+    framework = create_framework(request, meta=meta)
+    base_events_type = type(ops.CharmBase.on)
+
+    charm = MyCharm(framework)
+    other = OtherCharm(framework)
+
+    assert isinstance(charm.on, base_events_type)
+    assert isinstance(other.on, base_events_type)
+    assert type(charm.on) is not type(other.on)
+    assert type(charm.on).__name__ == base_events_type.__name__
+    assert isinstance(charm.on.db_relation_joined, ops.BoundEvent)
+    assert isinstance(other.on.db_relation_joined, ops.BoundEvent)
+    assert not hasattr(base_events_type, 'db_relation_joined')
+
+
+class _ReusedCharm(ops.CharmBase):
+    pass
+
+
+def test_metadata_events_reused_charm_class(request: pytest.FixtureRequest):
+    # The same charm class is instantiated under a new framework (and a new
+    # CharmBase.on), so its metadata events must be defined again on a new type.
+    meta = ops.CharmMeta.from_yaml("""
+name: my-charm
+requires:
+  db:
+    interface: db
+""")
+    first = _ReusedCharm(create_framework(request, meta=meta))
+    first_events_type = type(first.on)
+
+    second = _ReusedCharm(create_framework(request, meta=meta))
+
+    assert type(second.on) is not first_events_type
+    assert isinstance(second.on, type(ops.CharmBase.on))
+    assert 'db_relation_created' in type(second.on).__dict__
+    assert isinstance(second.on.db_relation_created, ops.BoundEvent)
+    assert isinstance(second.on.custom, ops.BoundEvent)
+
+
 def test_relation_events(request: pytest.FixtureRequest):
     class MyCharm(ops.CharmBase):
         def __init__(self, framework: ops.Framework):
@@ -14,7 +14,6 @@
 
 import os
 import pathlib
-import shutil
 import subprocess
 import tempfile
 import typing
@@ -27,80 +26,83 @@ from ops.jujucontext import _JujuContext
 from ops.model import _ModelBackend
 from ops.storage import SQLiteStorage
 
+# The .bat wrappers are only needed where the shell looks commands up by PATHEXT (Windows).
+_WRITE_BAT = '.BAT' in os.environ.get('PATHEXT', '').upper().split(os.pathsep)
+
+# Before executing the provided script, dump the provided arguments in calls.txt.
+# ASCII 1E is RS 'record separator', and 1C is FS 'file separator', which seem appropriate.
+_FAKE_SCRIPT_TEMPLATE = """#!/bin/sh
+{{ printf {name}; printf "\\036%s" "$@"; printf "\\034"; }} >> {path}/calls.txt
+{content}"""
+
 
 def fake_script(test_case: unittest.TestCase, name: str, content: str):
     if not hasattr(test_case, 'fake_script_path'):
-        fake_script_path = tempfile.mkdtemp('-fake_script')
+        tmp = tempfile.TemporaryDirectory(suffix='-fake_script')
+        fake_script_path = tmp.name
         old_path = os.environ['PATH']
-        os.environ['PATH'] = os.pathsep.join([fake_script_path, os.environ['PATH']])
-
-        def cleanup():
-            shutil.rmtree(fake_script_path)
-            os.environ['PATH'] = old_path
-
-        test_case.addCleanup(cleanup)
+        os.environ['PATH'] = os.pathsep.join([fake_script_path, old_path])
+        test_case.addCleanup(tmp.cleanup)
+        test_case.addCleanup(os.environ.__setitem__, 'PATH', old_path)
         test_case.fake_script_path = pathlib.Path(fake_script_path)  # type: ignore
 
-    template_args: typing.Dict[str, str] = {
-        'name': name,
-        'path': test_case.fake_script_path.as_posix(),  # type: ignore
-        'content': content,
-    }
-
     path: pathlib.Path = test_case.fake_script_path / name  # type: ignore
-    with path.open('wt') as f:  # type: ignore
-        # Before executing the provided script, dump the provided arguments in calls.txt.
-        # ASCII 1E is RS 'record separator', and 1C is FS 'file separator', which seem appropriate.
-        f.write(  # type: ignore
-            """#!/bin/sh
-{{ printf {name}; printf "\\036%s" "$@"; printf "\\034"; }} >> {path}/calls.txt
-{content}""".format_map(template_args)
+    # Create the script executable up front, rather than writing it and then chmod-ing it.
+    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755), 'w') as f:
+        f.write(
+            _FAKE_SCRIPT_TEMPLATE.format(
+                name=name,
+                path=test_case.fake_script_path.as_posix(),  # type: ignore
+                content=content,
+            )
+        )
+    if _WRITE_BAT:
+        # TODO: this hardcodes the path to bash.exe, which works for now but might
+        #       need to be set via environ or something like that.
+        path.with_suffix('.bat').write_text(  # type: ignore
+            f'@"C:\\Program Files\\git\\bin\\bash.exe" {path} %*\n'
         )
-    os.chmod(str(path), 0o755)  # type: ignore  # noqa: S103
-    # TODO: this hardcodes the path to bash.exe, which works for now but might
-    #       need to be set via environ or something like that.
-    path.with_suffix('.bat').write_text(  # type: ignore
-        f'@"C:\\Program Files\\git\\bin\\bash.exe" {path} %*\n'
-    )
 
 
 def fake_script_calls(
     test_case: unittest.TestCase, clear: bool = False
 ) -> typing.List[typing.List[str]]:
     calls_file: pathlib.Path = test_case.fake_script_path / 'calls.txt'  # type: ignore
-    if not calls_file.exists():  # type: ignore
+    try:
+        # newline and encoding forced to linuxy defaults because on
+        # windows they're written from git-bash
+        f = calls_file.open('r+t', newline='\n', encoding='utf8')  # type: ignore
+    except FileNotFoundError:
         return []
-
-    # newline and encoding forced to linuxy defaults because on
-    # windows they're written from git-bash
-    with calls_file.open('r+t', newline='\n', encoding='utf8') as f:  # type: ignore
+    with f:
         calls = [line.split('\x1e') for line in f.read().split('\x1c')[:-1]]  # type: ignore
         if clear:
             f.truncate(0)  # type: ignore
     return calls  # type: ignore
 
 
+class _CustomEvent(ops.EventBase):
+    pass
+
+
+_TEST_BIN_DIR = str(pathlib.Path(__file__).parent / 'bin')
+
+
 def create_framework(
     request: pytest.FixtureRequest, *, meta: typing.Optional[ops.CharmMeta] = None
 ):
     env_backup = os.environ.copy()
-    os.environ['PATH'] = os.pathsep.join([
-        str(pathlib.Path(__file__).parent / 'bin'),
-        os.environ['PATH'],
-    ])
+    os.environ['PATH'] = os.pathsep.join([_TEST_BIN_DIR, os.environ['PATH']])
     os.environ['JUJU_UNIT_NAME'] = 'local/0'
     os.environ['JUJU_VERSION'] = '0.0.0'
 
-    tmpdir = pathlib.Path(tempfile.mkdtemp())
-
-    class CustomEvent(ops.EventBase):
-        pass
+    tmpdir = request.getfixturevalue('tmp_path_factory').mktemp('framework')
 
     class TestCharmEvents(ops.CharmEvents):
-        custom = ops.EventSource(CustomEvent)
+        custom = ops.EventSource(_CustomEvent)
 
-    # Relations events are defined dynamically and modify the class attributes.
-    # We use a subclass temporarily to prevent these side effects from leaking.
+    # A new events type for each framework gives charm classes that are reused
+    # across tests a fresh type to define their metadata events on.
     ops.CharmBase.on = TestCharmEvents()  # type: ignore
 
     if meta is None:
@@ -118,7 +120,6 @@ def create_framework(
     def finalizer():
         os.environ.clear()
         os.environ.update(env_backup)
-        shutil.rmtree(tmpdir)
         ops.CharmBase.on = ops.CharmEvents()  # type: ignore
         framework.close()
 
@@ -127,71 +128,89 @@ def create_framework(
     return framework
 
 
+# Before executing the provided script, dump the provided arguments in calls.txt.
+# RS 'record separator' (octal 036 in ASCII), FS 'file separator' (octal 034 in ASCII).
+_FAKE_SCRIPT_WITH_SECRETS_TEMPLATE = """#!/bin/sh
+{{ printf {name}; printf "\\036%s" "$@"; printf "\\034"; }} >> {path}/calls.txt
+
+# Capture key and data from key#file=/some/path arguments
+for word in "$@"; do
+  echo "$word" | grep -q "#file=" || continue
+  key=$(echo "$word" | cut -d'#' -f1)
+  path=$(echo "$word" | cut -d'=' -f2)
+  cp "$path" "{path}/$key.secret"
+done
+
+{content}"""
+
+
 class FakeScript:
+    __slots__ = ('_calls_file', '_calls_path', '_dir', '_posix_path', 'path')
+
     def __init__(
         self,
         request: pytest.FixtureRequest,
         path: typing.Optional[pathlib.Path] = None,
     ):
         if path is None:
-            fake_script_path = tempfile.mkdtemp('-fake_script')
-            self.path = pathlib.Path(fake_script_path)
+            # Each test still gets its own directory, so that scripts never leak
+            # between tests, but removing it is left to pytest's tmp_path cleanup.
+            tmp_path_factory: pytest.TempPathFactory = request.getfixturevalue('tmp_path_factory')
+            self.path = tmp_path_factory.mktemp('fake_script')
             old_path = os.environ['PATH']
-            os.environ['PATH'] = os.pathsep.join([fake_script_path, os.environ['PATH']])
+            os.environ['PATH'] = os.pathsep.join([str(self.path), old_path])
 
             def cleanup():
-                shutil.rmtree(self.path)
                 os.environ['PATH'] = old_path
 
             request.addfinalizer(cleanup)
         else:
             self.path = path
+        # The calls file is opened on first read and kept open for the rest of the test.
+        self._calls_file: typing.Optional[typing.TextIO] = None
+        request.addfinalizer(self._close_calls_file)
+        # Scripts are written and called often, so build the path strings once up front.
+        self._dir = os.fspath(self.path)
+        self._calls_path = os.path.join(self._dir, 'calls.txt')
+        self._posix_path = self.path.as_posix()
 
     def write(self, name: str, content: str):
-        template_args: typing.Dict[str, str] = {
-            'name': name,
-            'path': self.path.as_posix(),
-            'content': content,
-        }
-
-        path: pathlib.Path = self.path / name
-        with path.open('wt') as f:
-            # Before executing the provided script, dump the provided arguments in calls.txt.
-            # RS 'record separator' (octal 036 in ASCII), FS 'file separator' (octal 034 in ASCII).
+        path = os.path.join(self._dir, name)
+        # Create the script executable up front, rather than writing it and then chmod-ing it.
+        with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755), 'w') as f:
             f.write(
-                """#!/bin/sh
-{{ printf {name}; printf "\\036%s" "$@"; printf "\\034"; }} >> {path}/calls.txt
-
-# Capture key and data from key#file=/some/path arguments
-for word in "$@"; do
-  echo "$word" | grep -q "#file=" || continue
-  key=$(echo "$word" | cut -d'#' -f1)
-  path=$(echo "$word" | cut -d'=' -f2)
-  cp "$path" "{path}/$key.secret"
-done
-
-{content}""".format_map(template_args)
+                _FAKE_SCRIPT_WITH_SECRETS_TEMPLATE.format(
+                    name=name, path=self._posix_path, content=content
+                )
             )
-        path.chmod(0o755)
-        # TODO: this hardcodes the path to bash.exe, which works for now but might
-        #       need to be set via environ or something like that.
-        path.with_suffix('.bat').write_text(
-            f'@"C:\\Program Files\\git\\bin\\bash.exe" {path} %*\n'
-        )
+        if _WRITE_BAT:
+            # TODO: this hardcodes the path to bash.exe, which works for now but might
+            #       need to be set via environ or something like that.
+            with open(os.path.splitext(path)[0] + '.bat', 'w') as f:
+                f.write(f'@"C:\\Program Files\\git\\bin\\bash.exe" {path} %*\n')
 
     def calls(self, clear: bool = False) -> typing.List[typing.List[str]]:
-        calls_file: pathlib.Path = self.path / 'calls.txt'
-        if not calls_file.exists():
-            return []
-
-        # Newline and encoding forced to Linux-y defaults because on
-        # windows they're written from git-bash.
-        with calls_file.open('r+t', newline='\n', encoding='utf8') as f:
-            calls = [line.split('\036') for line in f.read().split('\034')[:-1]]
-            if clear:
-                f.truncate(0)
+        f = self._calls_file
+        if f is None:
+            try:
+                # Newline and encoding forced to Linux-y defaults because on
+                # windows they're written from git-bash.
+                f = open(self._calls_path, 'r+t', newline='\n', encoding='utf8')  # noqa: SIM115
+            except FileNotFoundError:
+                return []
+            self._calls_file = f
+        # Seeking drops anything buffered, so appends made by the scripts are always seen.
+        f.seek(0)
+        calls = [line.split('\036') for line in f.read().split('\034')[:-1]]
+        if clear:
+            f.truncate(0)
         return calls
 
+    def _close_calls_file(self):
+        if self._calls_file is not None:
+            self._calls_file.close()
+            self._calls_file = None
+
     def secrets(self) -> typing.Dict[str, str]:
         return {p.stem: p.read_text() for p in self.path.iterdir() if p.suffix == '.secret'}
 
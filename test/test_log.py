@@ -89,6 +89,39 @@ class TestLogging:
         logger.warning('bar')
         assert backend.calls() == [('WARNING', 'bar')]
 
+    def test_handler_formatting(self, backend: FakeModelBackend, logger: logging.Logger):
+        handler = ops.log.JujuLogHandler(backend)
+        logger.addHandler(handler)
+        logger.warning('foo %s %d', 'bar', 42)
+        try:
+            raise ValueError('baz')
+        except ValueError:
+            logger.exception('oops')
+        calls = backend.calls(clear=True)
+        assert len(calls) == 2
+        assert calls[0] == ('WARNING', 'foo bar 42')
+        level, message = calls[1]
+        assert level == 'ERROR'
+        assert message.startswith('oops\nTraceback (most recent call last):\n')
+        assert message.endswith('ValueError: baz')
+
+        # Records rebuilt elsewhere (e.g. by makeLogRecord) may carry the traceback text only.
+        handler.handle(
+            logging.makeLogRecord({
+                'msg': 'boom',
+                'levelname': 'ERROR',
+                'levelno': logging.ERROR,
+                'exc_text': 'Traceback (most recent call last):\nValueError: boom',
+            })
+        )
+        assert backend.calls(clear=True) == [
+            ('ERROR', 'boom\nTraceback (most recent call last):\nValueError: boom')
+        ]
+
+        handler.setFormatter(logging.Formatter('formatted: %(message)s'))
+        logger.info('qux')
+        assert backend.calls() == [('INFO', 'formatted: qux')]
+
     def test_no_stderr_without_debug(self, backend: FakeModelBackend, logger: logging.Logger):
         buffer = io.StringIO()
         with patch('sys.stderr', buffer):
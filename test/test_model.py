@@ -2676,6 +2676,14 @@ class TestModelBackend:
             self._backend = _ModelBackend('myapp/0')
         return self._backend
 
+    @property
+    def model(self):
+        model_instance = getattr(self, '_model', None)
+        if model_instance is None:
+            meta = ops.CharmMeta.from_yaml('name: myapp')
+            self._model = ops.Model(meta, self.backend)
+        return self._model
+
     def test_relation_get_set_is_app_arg(self):
         # No is_app provided.
         with pytest.raises(TypeError):
@@ -2693,10 +2701,7 @@ class TestModelBackend:
                 self.backend.relation_get(1, 'fooentity', is_app=is_app_v)  # type: ignore
 
     def test_is_leader_refresh(self, fake_script: FakeScript):
-        meta = ops.CharmMeta.from_yaml("""
-            name: myapp
-        """)
-        model = ops.Model(meta, self.backend)
+        model = self.model
         fake_script.write('is-leader', 'echo false')
         assert not model.unit.is_leader()
 
@@ -2713,6 +2718,14 @@ class TestModelBackend:
         self.backend._leader_check_time = None
         assert model.unit.is_leader()
 
+        # Once the lease period has passed, we check again.
+        fake_script.write('is-leader', 'echo false')
+        assert model.unit.is_leader()
+        assert self.backend._leader_check_time is not None
+        lease_seconds = self.backend.LEASE_RENEWAL_PERIOD.total_seconds()
+        self.backend._leader_check_time -= lease_seconds + 1
+        assert not model.unit.is_leader()
+
     def test_relation_tool_errors(self, fake_script: FakeScript, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.setattr(
             self.backend, '_juju_context', _JujuContext.from_dict({'JUJU_VERSION': '2.8.0'})
@@ -2872,27 +2885,26 @@ class TestModelBackend:
             ['status-get', '--include-data', '--application=True', '--format=json'],
         ]
 
-    def test_status_is_app_forced_kwargs(self, fake_script: FakeScript):
-        fake_script.write('status-get', 'exit 1')
-        fake_script.write('status-set', 'exit 1')
-
-        test_cases = (
-            lambda: self.backend.status_get(False),  # type: ignore
-            lambda: self.backend.status_get(True),  # type: ignore
-            lambda: self.backend.status_set('active', '', False),  # type: ignore
-            lambda: self.backend.status_set('active', '', True),  # type: ignore
-        )
+    @pytest.mark.parametrize(
+        'method,args',
+        [
+            ('status_get', (False,)),
+            ('status_get', (True,)),
+            ('status_set', ('active', '', False)),
+            ('status_set', ('active', '', True)),
+        ],
+    )
+    def test_status_is_app_forced_kwargs(
+        self, fake_script: FakeScript, method: str, args: typing.Tuple[typing.Any, ...]
+    ):
+        fake_script.write(method.replace('_', '-'), 'exit 1')
 
-        for case in test_cases:
-            with pytest.raises(TypeError):
-                case()
+        with pytest.raises(TypeError):
+            getattr(self.backend, method)(*args)
 
     def test_local_set_invalid_status(self, fake_script: FakeScript):
         # ops will directly raise InvalidStatusError if you try to set status to unknown or error
-        meta = ops.CharmMeta.from_yaml("""
-            name: myapp
-        """)
-        model = ops.Model(meta, self.backend)
+        model = self.model
         fake_script.write('is-leader', 'echo true')
 
         with pytest.raises(ops.InvalidStatusError):
@@ -2922,10 +2934,7 @@ class TestModelBackend:
             'error': ops.ErrorStatus,
         }
 
-        meta = ops.CharmMeta.from_yaml("""
-            name: myapp
-        """)
-        model = ops.Model(meta, self.backend)
+        model = self.model
 
         content = json.dumps({
             'message': 'foo',
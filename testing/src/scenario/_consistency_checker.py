@@ -18,6 +18,7 @@ can set the ``SCENARIO_SKIP_CONSISTENCY_CHECKS`` environment variable and skip
 it altogether.
 """
 
+import functools
 import marshal
 import os
 import re
@@ -54,6 +55,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = scenario_logger.getChild("consistency_checker")
 
+# cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
+_SECRET_ID_RE = re.compile(r"secret:[0-9a-z]{20}$")
+
 
 class Results(NamedTuple):
     """Consistency checker return type.
@@ -66,6 +70,11 @@ class Results(NamedTuple):
     warnings: Iterable[str]
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_juju_version(juju_version: str) -> Tuple[int, ...]:
+    return tuple(map(int, juju_version.split(".")))
+
+
 def check_consistency(
     state: "State",
     event: "_Event",
@@ -89,12 +98,12 @@ def check_consistency(
     that are not in the charm's ``charmcraft.yaml`` is nonsense, and the
     combination of the two is inconsistent.
     """
-    juju_version_: Tuple[int, ...] = tuple(map(int, juju_version.split(".")))
-
     if os.getenv("SCENARIO_SKIP_CONSISTENCY_CHECKS"):
         logger.info("skipping consistency checks.")
         return
 
+    juju_version_ = _parse_juju_version(juju_version)
+
     errors: List[str] = []
     warnings: List[str] = []
 
@@ -410,8 +419,18 @@ def check_storages_consistency(
 
 def _is_secret_identifier(value: Union[str, int, float, bool]) -> bool:
     """Return true iff the value is in the form `secret:{secret id}`."""
-    # cf. https://github.com/juju/juju/blob/13eb9df3df16a84fd471af8a3c95ddbd04389b71/core/secrets/secret.go#L48
-    return bool(re.match(r"secret:[0-9a-z]{20}$", str(value)))
+    return bool(_SECRET_ID_RE.match(str(value)))
+
+
+_CONFIG_TYPE_CONVERTERS: Dict[str, type] = {
+    "string": str,
+    "int": int,
+    "float": float,
+    "boolean": bool,
+}
+_CONFIG_TYPE_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "secret": _is_secret_identifier,
+}
 
 
 def check_config_consistency(
@@ -426,32 +445,24 @@ def check_config_consistency(
     meta_config = (charm_spec.config or {}).get("options", {})
     errors: List[str] = []
 
+    converters = _CONFIG_TYPE_CONVERTERS
+    if juju_version >= (3, 4):
+        converters = {**converters, "secret": str}
+
     for key, value in state_config.items():
-        if key not in meta_config:
+        option_meta = meta_config.get(key)
+        if option_meta is None:
             errors.append(
                 f"config option {key!r} in state.config but not specified in config.yaml or "
                 f"charmcraft.yaml.",
             )
             continue
 
-        converters = {
-            "string": str,
-            "int": int,
-            "float": float,
-            "boolean": bool,
-        }
-        if juju_version >= (3, 4):
-            converters["secret"] = str
-
-        validators = {
-            "secret": _is_secret_identifier,
-        }
-
-        expected_type_name = meta_config[key].get("type", None)
+        expected_type_name = option_meta.get("type", None)
         if not expected_type_name:
             errors.append(f"config.yaml invalid; option {key!r} has no 'type'.")
             continue
-        validator = validators.get(expected_type_name)
+        validator = _CONFIG_TYPE_VALIDATORS.get(expected_type_name)
 
         expected_type = converters.get(expected_type_name)
         if not expected_type:
@@ -493,7 +504,7 @@ def check_secrets_consistency(
             f"(a secret with the same ID is not sufficient - you must pass the object "
             f"in the state to the event).",
         )
-    elif juju_version < (3,):
+    elif juju_version[0] < 3:
         errors.append(
             f"secrets are not supported in the specified juju version {juju_version}. "
             f"Should be at least 3.0.",
@@ -621,12 +632,8 @@ def check_containers_consistency(
 
     # event names will be normalized; need to compare against normalized container names.
     meta = charm_spec.meta
-    meta_containers = list(map(_normalise_name, meta.get("containers", {})))
-    state_containers = [_normalise_name(c.name) for c in state.containers]
-    all_notices = {notice.id for c in state.containers for notice in c.notices}
-    all_checks = {
-        (c.name, check.name) for c in state.containers for check in c.check_infos
-    }
+    meta_containers = set(map(_normalise_name, meta.get("containers", {})))
+    state_containers = {_normalise_name(c.name) for c in state.containers}
     errors: List[str] = []
 
     # it's fine if you have containers in meta that are not in state.containers (yet), but it's
@@ -634,7 +641,7 @@ def check_containers_consistency(
     # - you're processing a Pebble event and that container is not in state.containers or
     #   meta.containers
     if event._is_workload_event:
-        evt_container_name = event.name.split("_pebble_")[0]
+        evt_container_name = event.name[: -len(event._path.suffix)]
         if evt_container_name not in meta_containers:
             errors.append(
                 f"the event being processed concerns container {evt_container_name!r}, but a "
@@ -647,15 +654,21 @@ def check_containers_consistency(
                 f"consistent, if it cannot connect; but it should at least be there.",
             )
         # - you're processing a Notice event and that notice is not in any of the containers
-        if event.notice and event.notice.id not in all_notices:
+        if event.notice and not any(
+            notice.id == event.notice.id
+            for c in state.containers
+            for notice in c.notices
+        ):
             errors.append(
                 f"the event being processed concerns notice {event.notice!r}, but that "
                 "notice is not in any of the containers present in the state.",
             )
         # - you're processing a Check event and that check is not in the check's container
-        if (
-            event.check_info
-            and (evt_container_name, event.check_info.name) not in all_checks
+        if event.check_info and not any(
+            check.name == event.check_info.name
+            for c in state.containers
+            if c.name == evt_container_name
+            for check in c.check_infos
         ):
             errors.append(
                 f"the event being processed concerns check {event.check_info.name}, but that "
@@ -663,7 +676,7 @@ def check_containers_consistency(
             )
 
     # - a container in state.containers is not in meta.containers
-    if diff := (set(state_containers).difference(set(meta_containers))):
+    if diff := state_containers - meta_containers:
         errors.append(
             f"some containers declared in the state are not specified in metadata. "
             f"That's not possible. "
@@ -5,10 +5,21 @@
 import dataclasses
 import logging
 import marshal
+import pickle
 import re
 import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Sequence, Set
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import ops
 import ops.jujucontext
@@ -43,59 +54,83 @@ class UnitStateDB:
     def __init__(self, underlying_store: ops.storage.SQLiteStorage):
         self._db = underlying_store
 
+    def _load_raw_snapshots(self) -> Dict[str, bytes]:
+        """Fetch the pickled data of every snapshot in the db with a single query."""
+        # SQLiteStorage only loads snapshots one handle at a time. Keep the order that
+        # list_snapshots() gives.
+        rows = self._db._db.execute("SELECT handle, data FROM snapshot ORDER BY handle")
+        return dict(rows)
+
     def get_stored_states(self) -> FrozenSet["StoredState"]:
         """Load any StoredState data structures from the db."""
-        db = self._db
         stored_states: Set[StoredState] = set()
-        for handle_path in db.list_snapshots():
-            if not EVENT_REGEX.match(handle_path) and (
-                match := STORED_STATE_REGEX.match(handle_path)
-            ):
-                stored_state_snapshot = db.load_snapshot(handle_path)
-                kwargs = match.groupdict()
-                sst = StoredState(content=stored_state_snapshot, **kwargs)
+        for handle_path, data in self._load_raw_snapshots().items():
+            # Both event and stored state handle paths end with a bracketed key, so
+            # anything else can be skipped without running either pattern.
+            if "[" not in handle_path or EVENT_REGEX.match(handle_path):
+                continue
+            if match := STORED_STATE_REGEX.fullmatch(handle_path):
+                owner_path, data_type_name, name = match.group(
+                    "owner_path", "_data_type_name", "name"
+                )
+                sst = StoredState(
+                    name=name,
+                    owner_path=owner_path,
+                    content=pickle.loads(data),  # noqa: S301
+                    _data_type_name=data_type_name,
+                )
                 stored_states.add(sst)
 
         return frozenset(stored_states)
 
     def get_deferred_events(self) -> List["DeferredEvent"]:
         """Load any DeferredEvent data structures from the db."""
-        db = self._db
+        notices: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+        for notice in self._db.notices():
+            notices[notice[0]].append(notice)
+
         deferred: List[DeferredEvent] = []
-        for handle_path in db.list_snapshots():
-            if EVENT_REGEX.match(handle_path):
-                notices = db.notices(handle_path)
-                for handle, owner, observer in notices:
-                    try:
-                        snapshot_data = db.load_snapshot(handle)
-                    except ops.storage.NoSnapshotError:
-                        snapshot_data: Dict[str, Any] = {}
-
-                    event = DeferredEvent(
-                        handle_path=handle,
-                        owner=owner,
-                        observer=observer,
-                        snapshot_data=snapshot_data,
-                    )
-                    deferred.append(event)
+        for handle_path, data in self._load_raw_snapshots().items():
+            if handle_path not in notices or not EVENT_REGEX.match(handle_path):
+                continue
+            for handle, owner, observer in notices[handle_path]:
+                event = DeferredEvent(
+                    handle_path=handle,
+                    owner=owner,
+                    observer=observer,
+                    snapshot_data=pickle.loads(data),  # noqa: S301
+                )
+                deferred.append(event)
 
         return deferred
 
     def apply_state(self, state: "State"):
         """Add DeferredEvent and StoredState from this State instance to the storage."""
         db = self._db
+        # Validate everything up front, so that bad data doesn't leave a partially
+        # written store behind. Most deferred events carry no data, and there is
+        # nothing to check for those.
         for event in state.deferred:
-            db.save_notice(event.handle_path, event.owner, event.observer)
+            if not event.snapshot_data:
+                continue
             try:
                 marshal.dumps(event.snapshot_data)
             except ValueError as e:
                 raise ValueError(
                     f"unable to save the data for {event}, it must contain only simple types.",
                 ) from e
-            db.save_snapshot(event.handle_path, event.snapshot_data)
 
-        for stored_state in state.stored_states:
-            db.save_snapshot(stored_state._handle_path, stored_state.content)
+        # SQLiteStorage runs in autocommit mode, so batch the writes explicitly. The
+        # connection's context manager commits at the end, or rolls back if a write
+        # fails (for example, stored state content that can't be pickled).
+        db._db.execute("BEGIN")
+        with db._db:
+            for event in state.deferred:
+                db.save_notice(event.handle_path, event.owner, event.observer)
+                db.save_snapshot(event.handle_path, event.snapshot_data)
+
+            for stored_state in state.stored_states:
+                db.save_snapshot(stored_state._handle_path, stored_state.content)
 
 
 class Ops(_Manager):
@@ -154,9 +189,10 @@ class Ops(_Manager):
     def _make_storage(self, _: _Dispatcher):
         # TODO: add use_juju_for_storage support
         storage = ops.storage.SQLiteStorage(":memory:")
-        logger.info("Copying input state to storage.")
         self.store = UnitStateDB(storage)
-        self.store.apply_state(self.state)
+        if self.state.deferred or self.state.stored_states:
+            logger.info("Copying input state to storage.")
+            self.store.apply_state(self.state)
         return storage
 
     def _get_event_to_emit(self, event_name: str):
@@ -6,6 +6,7 @@
 
 import copy
 import dataclasses
+import os
 import tempfile
 import typing
 from contextlib import contextmanager
@@ -15,12 +16,12 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Type,
     TypeVar,
     Union,
 )
 
-import yaml
 from ops import (
     CollectStatusEvent,
     pebble,
@@ -32,6 +33,7 @@ from ops import (
     PreCommitEvent,
 )
 from ops.jujucontext import _JujuContext
+from ops._private.yaml import safe_dump as _safe_dump_yaml
 from ops._private.harness import ActionFailed
 
 from .errors import NoObserverError, UncaughtCharmError
@@ -85,16 +87,12 @@ class Runtime:
             "JUJU_DISPATCH_PATH": f"hooks/{event.name}",
             "JUJU_MODEL_NAME": state.model.name,
             "JUJU_MODEL_UUID": state.model.uuid,
-            "JUJU_CHARM_DIR": str(charm_root.absolute()),
+            "JUJU_CHARM_DIR": str(charm_root),
         }
 
         if event._is_action_event and (action := event.action):
-            env.update(
-                {
-                    "JUJU_ACTION_NAME": action.name.replace("_", "-"),
-                    "JUJU_ACTION_UUID": action.id,
-                },
-            )
+            env["JUJU_ACTION_NAME"] = action.name.replace("_", "-")
+            env["JUJU_ACTION_UUID"] = action.id
 
         if event._is_relation_event and (relation := event.relation):
             if isinstance(relation, PeerRelation):
@@ -103,19 +101,18 @@ class Runtime:
                 remote_app_name = relation.remote_app_name
             else:
                 raise ValueError(f"Unknown relation type: {relation}")
-            env.update(
-                {
-                    "JUJU_RELATION": relation.endpoint,
-                    "JUJU_RELATION_ID": str(relation.id),
-                    "JUJU_REMOTE_APP": remote_app_name,
-                },
-            )
+            env["JUJU_RELATION"] = relation.endpoint
+            env["JUJU_RELATION_ID"] = str(relation.id)
+            env["JUJU_REMOTE_APP"] = remote_app_name
 
             remote_unit_id = event.relation_remote_unit_id
+            # the event name was already split into prefix and suffix when the event was built
+            suffix = event._path.suffix
 
             # don't check truthiness because remote_unit_id could be 0
-            if remote_unit_id is None and not event.name.endswith(
-                ("_relation_created", "relation_broken"),
+            if remote_unit_id is None and suffix not in (
+                "_relation_created",
+                "_relation_broken",
             ):
                 remote_unit_ids = relation._remote_unit_ids
 
@@ -142,7 +139,7 @@ class Runtime:
             if remote_unit_id is not None:
                 remote_unit = f"{remote_app_name}/{remote_unit_id}"
                 env["JUJU_REMOTE_UNIT"] = remote_unit
-                if event.name.endswith("_relation_departed"):
+                if suffix == "_relation_departed":
                     if event.relation_departed_unit_id:
                         env["JUJU_DEPARTING_UNIT"] = (
                             f"{remote_app_name}/{event.relation_departed_unit_id}"
@@ -151,34 +148,26 @@ class Runtime:
                         env["JUJU_DEPARTING_UNIT"] = remote_unit
 
         if container := event.container:
-            env.update({"JUJU_WORKLOAD_NAME": container.name})
+            env["JUJU_WORKLOAD_NAME"] = container.name
 
         if notice := event.notice:
             if hasattr(notice.type, "value"):
                 notice_type = typing.cast(pebble.NoticeType, notice.type).value
             else:
                 notice_type = str(notice.type)
-            env.update(
-                {
-                    "JUJU_NOTICE_ID": notice.id,
-                    "JUJU_NOTICE_TYPE": notice_type,
-                    "JUJU_NOTICE_KEY": notice.key,
-                },
-            )
+            env["JUJU_NOTICE_ID"] = notice.id
+            env["JUJU_NOTICE_TYPE"] = notice_type
+            env["JUJU_NOTICE_KEY"] = notice.key
 
         if check_info := event.check_info:
             env["JUJU_PEBBLE_CHECK_NAME"] = check_info.name
 
         if storage := event.storage:
-            env.update({"JUJU_STORAGE_ID": f"{storage.name}/{storage.index}"})
+            env["JUJU_STORAGE_ID"] = f"{storage.name}/{storage.index}"
 
         if secret := event.secret:
-            env.update(
-                {
-                    "JUJU_SECRET_ID": secret.id,
-                    "JUJU_SECRET_LABEL": secret.label or "",
-                },
-            )
+            env["JUJU_SECRET_ID"] = secret.id
+            env["JUJU_SECRET_LABEL"] = secret.label or ""
             # Don't check truthiness because revision could be 0.
             if event.secret_revision is not None:
                 env["JUJU_SECRET_REVISION"] = str(event.secret_revision)
@@ -189,10 +178,14 @@ class Runtime:
     def _wrap(charm_type: Type["CharmType"]) -> Type["CharmType"]:
         # dark sorcery to work around framework using class attrs to hold on to event sources
         # this should only be needed if we call play multiple times on the same runtime.
-        class WrappedEvents(charm_type.on.__class__):
+        # The wrapped types can't be cached and reused: CharmBase.__init__ defines the
+        # metadata events on the events type, and ops refuses to define an event twice.
+        events_type = type(charm_type.on)
+
+        class WrappedEvents(events_type):
             """The charm's event sources, but wrapped."""
 
-        WrappedEvents.__name__ = charm_type.on.__class__.__name__
+        WrappedEvents.__name__ = events_type.__name__
 
         class WrappedCharm(charm_type):
             """The test charm's type, but with events wrapped."""
@@ -213,8 +206,9 @@ class Runtime:
 
         if charm_virtual_root := self._charm_root:
             charm_virtual_root_is_custom = True
-            virtual_charm_root = Path(charm_virtual_root)
+            virtual_charm_root = Path(charm_virtual_root).absolute()
         else:
+            # tempfile always gives an absolute path.
             charm_virtual_root = tempfile.TemporaryDirectory()
             virtual_charm_root = Path(charm_virtual_root.name)
             charm_virtual_root_is_custom = False
@@ -223,10 +217,14 @@ class Runtime:
         config_yaml = virtual_charm_root / "config.yaml"
         actions_yaml = virtual_charm_root / "actions.yaml"
 
+        existing_files: Set[str] = set()
+        if charm_virtual_root_is_custom:
+            # One directory listing rather than a stat() per metadata file.
+            with os.scandir(virtual_charm_root) as entries:
+                existing_files = {entry.name for entry in entries}
+
         metadata_files_present: Dict[Path, Optional[str]] = {
-            file: file.read_text()
-            if charm_virtual_root_is_custom and file.exists()
-            else None
+            file: file.read_text() if file.name in existing_files else None
             for file in (metadata_yaml, config_yaml, actions_yaml)
         }
 
@@ -258,16 +256,22 @@ class Runtime:
                 "To avoid this, clean any metadata files from the charm_root before calling run.",
             )
 
-        metadata_yaml.write_text(yaml.safe_dump(spec.meta))
-        config_yaml.write_text(yaml.safe_dump(spec.config or {}))
-        actions_yaml.write_text(yaml.safe_dump(spec.actions or {}))
+        rendered_metadata = spec._rendered_metadata
+        for file, previous_content in metadata_files_present.items():
+            content = rendered_metadata[file.name]
+            # An empty config or actions spec only needs writing out if it has to mask a
+            # file that is already in the (custom) charm root.
+            if content is None and previous_content is not None:
+                content = _safe_dump_yaml({})
+            if content is not None:
+                file.write_text(content)
 
         yield virtual_charm_root
 
         if charm_virtual_root_is_custom:
             for file, previous_content in metadata_files_present.items():
                 if previous_content is None:  # None == file did not exist before
-                    file.unlink()
+                    file.unlink(missing_ok=True)
                 else:
                     file.write_text(previous_content)
 
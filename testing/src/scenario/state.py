@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import functools
 import inspect
 import pathlib
 import random
@@ -39,6 +40,8 @@ import yaml
 
 import ops
 from ops import pebble, CharmBase, CharmEvents, SecretRotate, StatusBase
+from ops._private.yaml import safe_dump as _safe_dump_yaml
+from ops._private.yaml import safe_load as _safe_load_yaml
 from ops import CloudCredential as CloudCredential_Ops
 from ops import CloudSpec as CloudSpec_Ops
 
@@ -1616,14 +1619,18 @@ class _CharmSpec(Generic[CharmType]):
         # files for charm metadata.
         metadata_path = charm_root / "metadata.yaml"
         meta: dict[str, Any] = (
-            yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
+            _safe_load_yaml(metadata_path.read_text()) if metadata_path.exists() else {}
         )
 
         config_path = charm_root / "config.yaml"
-        config = yaml.safe_load(config_path.open()) if config_path.exists() else None
+        config = (
+            _safe_load_yaml(config_path.read_text()) if config_path.exists() else None
+        )
 
         actions_path = charm_root / "actions.yaml"
-        actions = yaml.safe_load(actions_path.open()) if actions_path.exists() else None
+        actions = (
+            _safe_load_yaml(actions_path.read_text()) if actions_path.exists() else None
+        )
         return meta, config, actions
 
     @staticmethod
@@ -1631,7 +1638,7 @@ class _CharmSpec(Generic[CharmType]):
         """Load metadata from charm projects created with Charmcraft >= 2.5."""
         metadata_path = charm_root / "charmcraft.yaml"
         meta: dict[str, Any] = (
-            yaml.safe_load(metadata_path.open()) if metadata_path.exists() else {}
+            _safe_load_yaml(metadata_path.read_text()) if metadata_path.exists() else {}
         )
         if not _is_valid_charmcraft_25_metadata(meta):
             meta = {}
@@ -1671,6 +1678,18 @@ class _CharmSpec(Generic[CharmType]):
             is_autoloaded=True,
         )
 
+    @functools.cached_property
+    def _rendered_metadata(self) -> dict[str, str | None]:
+        """The metadata files for this spec, by file name; None for empty config or actions.
+
+        The spec is frozen, so this is rendered once and reused by every run.
+        """
+        return {
+            "metadata.yaml": _safe_dump_yaml(self.meta),
+            "config.yaml": _safe_dump_yaml(self.config) if self.config else None,
+            "actions.yaml": _safe_dump_yaml(self.actions) if self.actions else None,
+        }
+
     def get_all_relations(self) -> list[tuple[str, dict[str, str]]]:
         """A list of all relation endpoints defined in the metadata."""
         return list(
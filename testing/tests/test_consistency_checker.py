@@ -167,6 +167,20 @@ def test_container_not_in_state():
     )
 
 
+def test_container_name_containing_pebble():
+    container = Container("foo-pebble-bar")
+    assert_consistent(
+        State(containers={container}),
+        _Event("foo-pebble-bar-pebble-ready", container=container),
+        _CharmSpec(MyCharm, {"containers": {"foo-pebble-bar": {}}}),
+    )
+    assert_inconsistent(
+        State(containers={container}),
+        _Event("foo-pebble-bar-pebble-ready", container=container),
+        _CharmSpec(MyCharm, {"containers": {"foo": {}}}),
+    )
+
+
 def test_evt_bad_container_name():
     assert_inconsistent(
         State(),
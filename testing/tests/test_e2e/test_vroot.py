@@ -89,3 +89,21 @@ def test_charm_virtual_root_cleanup_if_not_exists(charm_virtual_root):
         assert not meta_file.exists()
 
     assert not meta_file.exists()
+
+
+def test_charm_virtual_root_empty_config_masks_existing(charm_virtual_root):
+    actions_file = charm_virtual_root / "actions.yaml"
+    raw_ori_actions = yaml.safe_dump({"foo": {}})
+    actions_file.write_text(raw_ori_actions)
+    config_file = charm_virtual_root / "config.yaml"
+
+    ctx = Context(MyCharm, meta=MyCharm.META, charm_root=charm_virtual_root)
+    with ctx(ctx.on.start(), State()) as mgr:
+        # there was nothing to mask, so no empty config.yaml is written
+        assert not config_file.exists()
+        assert actions_file.read_text() == yaml.safe_dump({})
+        assert not mgr.charm.meta.actions
+        mgr.run()
+
+    assert not config_file.exists()
+    assert actions_file.read_text() == raw_ori_actions